@@ -6,26 +6,37 @@ This application provides endpoints to retrieve economic indicators
 using the Trading Economics Python package.
 
 Installation requirements:
-pip install fastapi uvicorn tradingeconomics pandas python-dotenv
+pip install fastapi uvicorn tradingeconomics python-dotenv cachetools orjson
 
 Usage:
 1. Set your Trading Economics API key as environment variable:
    export TRADING_ECONOMICS_API_KEY='your_api_key_here'
    
 2. Run the application:
-   uvicorn main:app --reload --host 0.0.0.0 --port 8000
+   uvicorn main:app --reload --host 0.0.0.0 --port 8000 --timeout-keep-alive 75
 
 3. Access the API documentation at: http://localhost:8000/docs
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import asyncio
+import random
+import secrets
+import threading
+import time
+import types
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime
-import pandas as pd
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 import tradingeconomics as te
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import logging
 
@@ -42,7 +53,8 @@ app = FastAPI(
     description="Access economic indicators for countries worldwide",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -54,8 +66,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Streamed NDJSON routes; gzip would buffer them until the stream closes
+UNCOMPRESSED_PATHS = frozenset({"/all-currency-pairs"})
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes streamed NDJSON routes through uncompressed"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress larger JSON responses (country lists, indicator lists)
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=500)
+
 # Initialize Trading Economics client
 API_KEY = os.getenv('TRADING_ECONOMICS_API_KEY', 'guest:guest')
+
+# Token required by admin endpoints; they are disabled when it is not set
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
 te.login(API_KEY)
 
 # Response models
@@ -74,7 +104,7 @@ class CountryEconomicData(BaseModel):
     gdp_growth: Optional[EconomicIndicator]
     inflation_rate: Optional[EconomicIndicator]
     unemployment_rate: Optional[EconomicIndicator]
-    last_updated: str
+    last_updated: datetime
 
 class CurrencyPairData(BaseModel):
     base_currency: str
@@ -82,51 +112,222 @@ class CurrencyPairData(BaseModel):
     base_country_data: CountryEconomicData
     quote_country_data: CountryEconomicData
 
+# Indicators reported for each country, as (response field, Trading Economics name)
+_INDICATORS = (
+    ('interest_rate', 'Interest Rate'),
+    ('gdp_growth', 'GDP Growth Rate'),
+    ('inflation_rate', 'Inflation Rate'),
+    ('unemployment_rate', 'Unemployment Rate'),
+)
+INDICATOR_NAMES = tuple(indicator for _, indicator in _INDICATORS)
+
+# Indicator cache: economic indicators update at most daily, so an hour is safe
+INDICATOR_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+INDICATOR_CACHE_LOCK = threading.Lock()
+CACHE_STATS = {'hits': 0, 'misses': 0}
+
 # Helper functions
-def safe_get_indicator_data(country: str, indicator: str) -> Optional[Dict]:
-    """Safely retrieve indicator data with error handling"""
+def lookup_cached_indicators(
+    countries: Sequence[str], indicators: Sequence[str]
+) -> Tuple[Dict[Tuple[str, str], EconomicIndicator], List[Tuple[str, str]]]:
+    """Split the requested pairs into cached results and pairs still missing"""
+    results = {}
+    missing = []
+    with INDICATOR_CACHE_LOCK:
+        for country in countries:
+            for indicator in indicators:
+                cached = INDICATOR_CACHE.get(f"{country}|{indicator}")
+                if cached is not None:
+                    CACHE_STATS['hits'] += 1
+                    results[(country, indicator)] = cached
+                else:
+                    CACHE_STATS['misses'] += 1
+                    missing.append((country, indicator))
+    return results, missing
+
+def _missing_batch(missing: List[Tuple[str, str]]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Countries and indicators for one upstream call covering every missing pair"""
+    return (
+        tuple(dict.fromkeys(country for country, _ in missing)),
+        tuple(dict.fromkeys(indicator for _, indicator in missing))
+    )
+
+def refresh_indicator_batch(countries: Sequence[str], indicators: Sequence[str]) -> Dict[Tuple[str, str], EconomicIndicator]:
+    """Fetch indicators from Trading Economics and overwrite their cache entries"""
+    fetched = fetch_indicator_data(list(countries), list(indicators))
+    with INDICATOR_CACHE_LOCK:
+        for (country, indicator), data in fetched.items():
+            INDICATOR_CACHE[f"{country}|{indicator}"] = data
+    return fetched
+
+def clear_indicator_cache() -> None:
+    """Drop all cached indicator data and reset the hit/miss counters"""
+    with INDICATOR_CACHE_LOCK:
+        INDICATOR_CACHE.clear()
+        CACHE_STATS['hits'] = 0
+        CACHE_STATS['misses'] = 0
+
+def _match_name(value: Any, names: Dict[str, str]) -> Optional[str]:
+    """Map a name returned by Trading Economics back to the requested spelling"""
+    if isinstance(value, str):
+        return names.get(value.lower())
+    # Without the column, a single requested name is unambiguous
+    if len(names) == 1:
+        return next(iter(names.values()))
+    return None
+
+def fetch_indicator_data(countries: List[str], indicators: List[str]) -> Dict[Tuple[str, str], EconomicIndicator]:
+    """Safely retrieve indicators for several countries in one Trading Economics call"""
+    results = {}
     try:
-        data = te.getIndicatorData(country=country, indicators=indicator, output_type='df')
-        if data is not None and not data.empty:
-            latest = data.iloc[-1]
-            return {
-                'country': latest.get('Country', country),
-                'indicator': indicator,
-                'value': latest.get('LastUpdate', None),
-                'previous_value': latest.get('PreviousValue', None),
-                'last_update': latest.get('LastUpdate', None),
-                'unit': latest.get('Unit', None),
-                'frequency': latest.get('Frequency', None)
-            }
+        # Plain dicts avoid building a DataFrame for these small responses
+        data = te.getIndicatorData(country=countries, indicators=indicators, output_type='dict')
+        if data:
+            country_names = {country.lower(): country for country in countries}
+            indicator_names = {indicator.lower(): indicator for indicator in indicators}
+            for row in data:
+                country_name = row.get('Country')
+                country = _match_name(country_name, country_names)
+                indicator = _match_name(row.get('Category'), indicator_names)
+                if country is None or indicator is None:
+                    continue
+                # Validate once here so cached records can be served as they are
+                try:
+                    record = EconomicIndicator(
+                        country=country_name if country_name is not None else country,
+                        indicator=indicator,
+                        value=row.get('LatestValue'),
+                        previous_value=row.get('PreviousValue'),
+                        last_update=row.get('LastUpdate'),
+                        unit=row.get('Unit'),
+                        frequency=row.get('Frequency')
+                    )
+                except ValidationError as e:
+                    logger.warning(f"Invalid {indicator} data for {country}: {str(e)}")
+                    continue
+                # Later rows overwrite earlier ones, keeping the latest per pair
+                results[(country, indicator)] = record
     except Exception as e:
-        logger.warning(f"Error fetching {indicator} for {country}: {str(e)}")
-    return None
+        logger.warning(f"Error fetching {', '.join(indicators)} for {', '.join(countries)}: {str(e)}")
+    return results
 
-def get_country_economic_data(country: str) -> CountryEconomicData:
-    """Get all economic indicators for a country"""
-    indicators = {
-        'interest_rate': 'Interest Rate',
-        'gdp_growth': 'GDP Growth Rate',
-        'inflation_rate': 'Inflation Rate',
-        'unemployment_rate': 'Unemployment Rate'
-    }
+# The Trading Economics client is synchronous, so its calls run on a
+# dedicated thread pool instead of blocking the event loop
+EXECUTOR = ThreadPoolExecutor(max_workers=32)
+
+# Current time, refreshed once a second by _tick so response builders
+# don't each call datetime.now()
+_NOW = [datetime.now()]
+
+async def _tick():
+    """Refresh the cached timestamp every second"""
+    while True:
+        _NOW[0] = datetime.now()
+        await asyncio.sleep(1)
+
+# Limit concurrent upstream calls to respect the Trading Economics rate limit.
+# Semaphores are bound to an event loop (at creation on Python < 3.10), so one
+# is created lazily for each running loop instead of at import time
+TE_CONCURRENCY = 8
+_TE_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def te_semaphore() -> asyncio.Semaphore:
+    """Return the upstream concurrency semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _TE_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _TE_SEMAPHORES[loop] = asyncio.Semaphore(TE_CONCURRENCY)
+    return semaphore
+
+async def run_blocking(func, *args):
+    """Run a blocking function on the shared executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXECUTOR, func, *args)
+
+# Upstream fetches currently running, keyed by (countries, indicators)
+_INFLIGHT: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], asyncio.Future] = {}
+
+async def _fetch_batch(countries: Sequence[str], indicators: Sequence[str]) -> Dict[Tuple[str, str], EconomicIndicator]:
+    """Run refresh_indicator_batch in a worker thread so the event loop is not blocked"""
+    async with te_semaphore():
+        return await run_blocking(refresh_indicator_batch, countries, indicators)
+
+def _release_inflight(key: Tuple[Tuple[str, ...], Tuple[str, ...]], future: asyncio.Future) -> None:
+    """Forget a finished batch fetch, unless a newer one has replaced it"""
+    if _INFLIGHT.get(key) is future:
+        del _INFLIGHT[key]
+
+async def _afetch(countries: Sequence[str], indicators: Sequence[str]) -> Dict[Tuple[str, str], EconomicIndicator]:
+    """Fetch a batch of indicators, sharing one upstream call between identical concurrent requests"""
+    # Cache hits are answered on the event loop; only missing pairs wait for
+    # a semaphore slot and a worker thread
+    results, missing = lookup_cached_indicators(countries, indicators)
+    if not missing:
+        return results
     
-    data = {}
-    for key, indicator in indicators.items():
-        indicator_data = safe_get_indicator_data(country, indicator)
-        if indicator_data:
-            data[key] = EconomicIndicator(**indicator_data)
-        else:
-            data[key] = None
+    key = _missing_batch(missing)
+    # Only share fetches started on this event loop
+    future = _INFLIGHT.get(key)
+    if future is None or future.get_loop() is not asyncio.get_running_loop():
+        future = asyncio.ensure_future(_fetch_batch(*key))
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda done: _release_inflight(key, done))
+    # Shield so one cancelled caller does not cancel the fetch for the others
+    results.update(await asyncio.shield(future))
+    return results
+
+async def get_indicator_for_countries(countries: Sequence[str], indicator: str) -> List[EconomicIndicator]:
+    """Fetch one indicator for several countries with a single upstream call"""
+    results = await _afetch(countries, [indicator])
+    return [results[(country, indicator)] for country in countries if (country, indicator) in results]
+
+async def get_country_economic_data(country: str) -> CountryEconomicData:
+    """Get all economic indicators for a country"""
+    results = await _afetch((country,), INDICATOR_NAMES)
     
     return CountryEconomicData(
         country=country,
-        **data,
-        last_updated=datetime.now().isoformat()
+        **{field: results.get((country, indicator)) for field, indicator in _INDICATORS},
+        last_updated=_NOW[0]
     )
 
+# Assembled country data, reused for a minute; only results with at least
+# one indicator are stored, so failed lookups are retried on the next request
+COUNTRY_DATA_CACHE: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+# Country data fetches currently running, keyed by country
+_COUNTRY_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+async def _fetch_country_data(country: str) -> CountryEconomicData:
+    """Get country data and cache it unless every indicator is missing"""
+    data = await get_country_economic_data(country)
+    if any(getattr(data, field) is not None for field, _ in _INDICATORS):
+        COUNTRY_DATA_CACHE[country] = data
+    return data
+
+def _release_country_inflight(country: str, future: asyncio.Future) -> None:
+    """Forget a finished fetch, unless a newer one has replaced it"""
+    if _COUNTRY_INFLIGHT.get(country) is future:
+        del _COUNTRY_INFLIGHT[country]
+
+async def get_cached_country_economic_data(country: str) -> CountryEconomicData:
+    """Get country data, reusing results computed within the last minute"""
+    data = COUNTRY_DATA_CACHE.get(country)
+    if data is not None:
+        return data
+    
+    # Share one fetch between concurrent callers on the same event loop
+    future = _COUNTRY_INFLIGHT.get(country)
+    if future is None or future.get_loop() is not asyncio.get_running_loop():
+        future = asyncio.ensure_future(_fetch_country_data(country))
+        _COUNTRY_INFLIGHT[country] = future
+        future.add_done_callback(lambda done: _release_country_inflight(country, done))
+    return await asyncio.shield(future)
+
 # Currency to country mapping (major currencies)
-CURRENCY_COUNTRY_MAP = {
+CURRENCY_COUNTRY_MAP = types.MappingProxyType({
     'USD': 'United States',
     'EUR': 'Euro Area',
     'GBP': 'United Kingdom',
@@ -151,7 +352,71 @@ CURRENCY_COUNTRY_MAP = {
     'ZAR': 'South Africa',
     'RUB': 'Russia',
     'TRY': 'Turkey'
-}
+})
+
+# Supported currency codes, for request validation
+CURRENCY_CODES = frozenset(CURRENCY_COUNTRY_MAP)
+
+# Default countries for the indicator list endpoints (top 10 major countries)
+TOP10_COUNTRIES = tuple(CURRENCY_COUNTRY_MAP.values())[:10]
+
+# Major pairs: each major currency against USD, EUR and GBP
+MAJOR_PAIRS = tuple(
+    (base, quote)
+    for base in ('USD', 'EUR', 'GBP')
+    for quote in ('USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD')
+    if base != quote
+)
+
+# Countries behind the major pairs, kept warm in the indicator cache
+MAJOR_COUNTRIES = tuple(dict.fromkeys(
+    CURRENCY_COUNTRY_MAP[currency] for pair in MAJOR_PAIRS for currency in pair
+))
+
+# The full country list barely changes, so it is fetched at most once a day
+COUNTRIES_CACHE_TTL = 86400
+COUNTRIES_CACHE: Dict[str, Any] = {'data': None, 'ts': 0.0}
+
+# Prewarm schedule; jitter keeps multiple workers from refreshing in lockstep
+PREWARM_INTERVAL = 300
+PREWARM_JITTER = 30
+PREWARM_STATUS: Dict[str, Any] = {'last_run': None, 'last_failure': None, 'indicators': 0}
+
+async def _prewarm_loop():
+    """Refresh the major-country indicators in the cache every few minutes"""
+    await asyncio.sleep(random.uniform(0, PREWARM_JITTER))
+    while True:
+        try:
+            async with te_semaphore():
+                fetched = await run_blocking(refresh_indicator_batch, MAJOR_COUNTRIES, INDICATOR_NAMES)
+            # fetch_indicator_data swallows upstream errors, so an empty
+            # result is how a failed refresh shows up
+            if fetched:
+                PREWARM_STATUS['last_run'] = datetime.now()
+                PREWARM_STATUS['indicators'] = len(fetched)
+            else:
+                PREWARM_STATUS['last_failure'] = datetime.now()
+                logger.warning("Prewarm fetched no indicators")
+        except Exception as e:
+            PREWARM_STATUS['last_failure'] = datetime.now()
+            logger.warning(f"Error prewarming indicator cache: {str(e)}")
+        await asyncio.sleep(PREWARM_INTERVAL + random.uniform(0, PREWARM_JITTER))
+
+# Background tasks started with the app, kept referenced until shutdown
+BACKGROUND_TASKS: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """Start the background tasks"""
+    BACKGROUND_TASKS.append(asyncio.create_task(_tick()))
+    BACKGROUND_TASKS.append(asyncio.create_task(_prewarm_loop()))
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """Cancel the background tasks"""
+    for task in BACKGROUND_TASKS:
+        task.cancel()
+    BACKGROUND_TASKS.clear()
 
 # API Endpoints
 @app.get("/")
@@ -168,20 +433,39 @@ async def root():
             "interest_rates": "/interest-rates",
             "gdp_growth": "/gdp-growth",
             "inflation": "/inflation",
-            "unemployment": "/unemployment"
+            "unemployment": "/unemployment",
+            "clear_cache": "/cache/clear"
         }
     }
 
-@app.get("/countries", response_model=List[str])
-async def get_available_countries():
-    """Get list of available countries"""
+def fetch_available_countries() -> Optional[List[str]]:
+    """Fetch the sorted list of countries from Trading Economics"""
     try:
-        countries_data = te.getIndicatorData(output_type='df')
-        if countries_data is not None and not countries_data.empty:
-            countries = sorted(countries_data['Country'].unique().tolist())
-            return countries
+        countries_data = te.getIndicatorData(output_type='dict')
+        if countries_data:
+            return sorted({row['Country'] for row in countries_data if row.get('Country')})
     except Exception as e:
         logger.error(f"Error fetching countries: {str(e)}")
+    return None
+
+@app.get("/countries", response_model=List[str])
+async def get_available_countries():
+    """Get list of available countries"""
+    if (
+        COUNTRIES_CACHE['data'] is not None
+        and time.time() - COUNTRIES_CACHE['ts'] < COUNTRIES_CACHE_TTL
+    ):
+        return list(COUNTRIES_CACHE['data'])
+    
+    countries = await run_blocking(fetch_available_countries)
+    if countries:
+        COUNTRIES_CACHE['data'] = countries
+        COUNTRIES_CACHE['ts'] = time.time()
+        return list(countries)
+    
+    # Serve a stale list rather than the short fallback if the refresh failed
+    if COUNTRIES_CACHE['data'] is not None:
+        return list(COUNTRIES_CACHE['data'])
     
     # Fallback to major countries
     return list(CURRENCY_COUNTRY_MAP.values())
@@ -195,7 +479,7 @@ async def get_available_currencies():
 async def get_country_indicators(country: str):
     """Get all economic indicators for a specific country"""
     try:
-        data = get_country_economic_data(country)
+        data = await get_cached_country_economic_data(country)
         return data
     except Exception as e:
         logger.error(f"Error fetching indicators for {country}: {str(e)}")
@@ -207,17 +491,20 @@ async def get_currency_pair_data(base: str, quote: str):
     base = base.upper()
     quote = quote.upper()
     
-    if base not in CURRENCY_COUNTRY_MAP:
+    if base not in CURRENCY_CODES:
         raise HTTPException(status_code=404, detail=f"Currency {base} not supported")
-    if quote not in CURRENCY_COUNTRY_MAP:
+    if quote not in CURRENCY_CODES:
         raise HTTPException(status_code=404, detail=f"Currency {quote} not supported")
     
-    base_country = CURRENCY_COUNTRY_MAP[base]
-    quote_country = CURRENCY_COUNTRY_MAP[quote]
+    currency_map = CURRENCY_COUNTRY_MAP
+    base_country = currency_map[base]
+    quote_country = currency_map[quote]
     
     try:
-        base_data = get_country_economic_data(base_country)
-        quote_data = get_country_economic_data(quote_country)
+        base_data, quote_data = await asyncio.gather(
+            get_cached_country_economic_data(base_country),
+            get_cached_country_economic_data(quote_country)
+        )
         
         return CurrencyPairData(
             base_currency=base,
@@ -235,15 +522,9 @@ async def get_interest_rates(
 ):
     """Get interest rates for specified countries or all major countries"""
     if not countries:
-        countries = list(CURRENCY_COUNTRY_MAP.values())[:10]  # Top 10 major countries
-    
-    results = []
-    for country in countries:
-        data = safe_get_indicator_data(country, 'Interest Rate')
-        if data:
-            results.append(EconomicIndicator(**data))
+        countries = TOP10_COUNTRIES
     
-    return results
+    return await get_indicator_for_countries(countries, 'Interest Rate')
 
 @app.get("/gdp-growth", response_model=List[EconomicIndicator])
 async def get_gdp_growth(
@@ -251,15 +532,9 @@ async def get_gdp_growth(
 ):
     """Get GDP growth rates for specified countries or all major countries"""
     if not countries:
-        countries = list(CURRENCY_COUNTRY_MAP.values())[:10]
-    
-    results = []
-    for country in countries:
-        data = safe_get_indicator_data(country, 'GDP Growth Rate')
-        if data:
-            results.append(EconomicIndicator(**data))
+        countries = TOP10_COUNTRIES
     
-    return results
+    return await get_indicator_for_countries(countries, 'GDP Growth Rate')
 
 @app.get("/inflation", response_model=List[EconomicIndicator])
 async def get_inflation_rates(
@@ -267,15 +542,9 @@ async def get_inflation_rates(
 ):
     """Get inflation rates for specified countries or all major countries"""
     if not countries:
-        countries = list(CURRENCY_COUNTRY_MAP.values())[:10]
-    
-    results = []
-    for country in countries:
-        data = safe_get_indicator_data(country, 'Inflation Rate')
-        if data:
-            results.append(EconomicIndicator(**data))
+        countries = TOP10_COUNTRIES
     
-    return results
+    return await get_indicator_for_countries(countries, 'Inflation Rate')
 
 @app.get("/unemployment", response_model=List[EconomicIndicator])
 async def get_unemployment_rates(
@@ -283,53 +552,88 @@ async def get_unemployment_rates(
 ):
     """Get unemployment rates for specified countries or all major countries"""
     if not countries:
-        countries = list(CURRENCY_COUNTRY_MAP.values())[:10]
-    
-    results = []
-    for country in countries:
-        data = safe_get_indicator_data(country, 'Unemployment Rate')
-        if data:
-            results.append(EconomicIndicator(**data))
+        countries = TOP10_COUNTRIES
     
-    return results
+    return await get_indicator_for_countries(countries, 'Unemployment Rate')
+
+async def _fetch_currency_country(currency: str) -> Tuple[str, Optional[CountryEconomicData]]:
+    """Get country data for a currency, logging and returning None on failure"""
+    try:
+        data = await get_cached_country_economic_data(CURRENCY_COUNTRY_MAP[currency])
+        # There is no response_model on the streaming route, so validate each
+        # country here; a bad country is then skipped instead of ending the stream
+        return currency, CountryEconomicData.model_validate(data.model_dump())
+    except Exception as e:
+        logger.warning(f"Error fetching data for {currency}: {str(e)}")
+        return currency, None
 
-@app.get("/all-currency-pairs", response_model=List[CurrencyPairData])
+async def _stream_major_currency_pairs():
+    """Yield each major pair as an NDJSON line as soon as both of its countries resolve"""
+    # Fetch each country once, then assemble pairs from the results
+    currencies = list(dict.fromkeys(currency for pair in MAJOR_PAIRS for currency in pair))
+    country_data = {}
+    for next_result in asyncio.as_completed([_fetch_currency_country(c) for c in currencies]):
+        currency, data = await next_result
+        if data is None:
+            continue
+        country_data[currency] = data
+        
+        # A pair is complete when the currency that just resolved was its last missing side
+        for base, quote in MAJOR_PAIRS:
+            if currency in (base, quote) and base in country_data and quote in country_data:
+                pair = CurrencyPairData(
+                    base_currency=base,
+                    quote_currency=quote,
+                    base_country_data=country_data[base],
+                    quote_country_data=country_data[quote]
+                )
+                yield orjson.dumps(pair.model_dump()) + b"\n"
+
+@app.get("/all-currency-pairs", response_class=StreamingResponse)
 async def get_all_major_currency_pairs():
-    """Get economic data for all major currency pairs"""
-    major_currencies = ['USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD']
-    pairs = []
-    
-    # Generate major pairs (each currency against USD, EUR, GBP)
-    base_currencies = ['USD', 'EUR', 'GBP']
-    
-    for base in base_currencies:
-        for quote in major_currencies:
-            if base != quote:
-                try:
-                    pair_data = await get_currency_pair_data(base, quote)
-                    pairs.append(pair_data)
-                except Exception as e:
-                    logger.warning(f"Error fetching pair {base}/{quote}: {str(e)}")
-                    continue
-    
-    return pairs
+    """Stream economic data for all major currency pairs as NDJSON, one pair per line"""
+    return StreamingResponse(_stream_major_currency_pairs(), media_type="application/x-ndjson")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     try:
         # Test Trading Economics connection
-        test_data = te.getIndicatorData(country='United States', indicators='Interest Rate', output_type='df')
+        test_data = await run_blocking(
+            lambda: te.getIndicatorData(country='United States', indicators='Interest Rate', output_type='dict')
+        )
         api_status = "healthy" if test_data is not None else "degraded"
     except Exception as e:
         api_status = f"error: {str(e)}"
     
+    with INDICATOR_CACHE_LOCK:
+        cache_info = {
+            "size": len(INDICATOR_CACHE),
+            "hits": CACHE_STATS['hits'],
+            "misses": CACHE_STATS['misses']
+        }
+    
     return {
         "status": "healthy",
         "trading_economics_api": api_status,
-        "timestamp": datetime.now().isoformat()
+        "cache": cache_info,
+        "prewarm": dict(PREWARM_STATUS),
+        "timestamp": datetime.now()
     }
 
+@app.post("/cache/clear")
+async def clear_cache(x_admin_token: Optional[str] = Header(None)):
+    """Clear the cached indicator data (requires the X-Admin-Token header)"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    
+    clear_indicator_cache()
+    COUNTRY_DATA_CACHE.clear()
+    return {"status": "cleared"}
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # A longer keep-alive lets clients reuse connections across polling intervals
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_keep_alive=75)
\ No newline at end of file